@@ -1,9 +1,32 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import random
-from collections import deque
+
+# Ring of byte values; page p is loaded with _RING[p:p + 256], i.e.
+# bytes (p + i) & 0xFF, as a zero-copy slice
+_RING = memoryview(bytes(i & 0xFF for i in range(512)))
+
+# Indices into MemorySimulator.stats
+TLB_HITS, TLB_MISSES, CACHE_HITS, CACHE_MISSES, PAGE_FAULTS, TOTAL_ACCESSES = range(6)
+
+def _parse_hex(address_str):
+    return int(address_str, 16)
+
+def _parse_decimal(address_str):
+    # A 0x prefix still selects hex in decimal mode
+    if address_str[:2].lower() == '0x':
+        return int(address_str, 16)
+    return int(address_str)
 
 class MemorySimulator:
+    # Fixed attribute set: no per-instance __dict__, and a mistyped
+    # attribute on the hot path fails loudly instead of creating a new one
+    __slots__ = (
+        'MEMORY_SIZE', 'PAGE_SIZE', 'TLB_SIZE', 'CACHE_SIZE', 'CACHE_LINE_SIZE', 'NUM_PAGES',
+        'verbose', '_OFFSET_BITS', '_INDEX_BITS', '_TAG_SHIFT', '_INDEX_MASK', '_OFFSET_MASK',
+        'main_memory', 'mem_mv', 'page_table', 'page_table_count', '_next_frame',
+        'tlb_tag', 'tlb_frame', 'cache_tag', 'cache_valid', 'cache_dirty', 'cache_data', 'stats'
+    )
+    
     def __init__(self):
         self.MEMORY_SIZE = 65536
         self.PAGE_SIZE = 256
@@ -12,102 +35,139 @@ class MemorySimulator:
         self.CACHE_LINE_SIZE = 8
         self.NUM_PAGES = self.MEMORY_SIZE // self.PAGE_SIZE
         
+        # Build log lines in translate_address; turn off for fast batch runs
+        self.verbose = True
+        
+        # Cache address split, computed once instead of on every access
+        self._OFFSET_BITS = (self.CACHE_LINE_SIZE - 1).bit_length()
+        self._INDEX_BITS = (self.CACHE_SIZE - 1).bit_length()
+        self._TAG_SHIFT = self._OFFSET_BITS + self._INDEX_BITS
+        self._INDEX_MASK = self.CACHE_SIZE - 1
+        self._OFFSET_MASK = self.CACHE_LINE_SIZE - 1
+        
         self.reset_simulator()
     
     def reset_simulator(self):
-        self.main_memory = bytearray([random.randint(0, 255) for _ in range(self.MEMORY_SIZE)])
-        self.page_table = {}
-        self.tlb = {}
-        self.tlb_queue = deque()
-        self.cache = [{'tag': -1, 'data': bytearray(self.CACHE_LINE_SIZE), 'valid': False, 'dirty': False} 
-                     for _ in range(self.CACHE_SIZE)]
-        self.stats = {
-            'tlb_hits': 0, 'tlb_misses': 0, 'cache_hits': 0, 
-            'cache_misses': 0, 'page_faults': 0, 'total_accesses': 0
-        }
+        self.main_memory = bytearray(self.MEMORY_SIZE)
+        self.mem_mv = memoryview(self.main_memory)
+        self.page_table = [-1] * self.NUM_PAGES   # frame for each page, -1 if unmapped
+        self.page_table_count = 0
+        self._next_frame = 0
+        self.tlb_tag = [-1] * self.TLB_SIZE      # page held by each slot, -1 if empty
+        self.tlb_frame = [0] * self.TLB_SIZE
+        # Cache as parallel lists: nothing here vectorizes, and list indexing
+        # is much cheaper than NumPy scalar access. Each 8-byte line is packed
+        # little-endian into one int.
+        self.cache_tag = [-1] * self.CACHE_SIZE
+        self.cache_valid = [False] * self.CACHE_SIZE
+        self.cache_dirty = [False] * self.CACHE_SIZE
+        self.cache_data = [0] * self.CACHE_SIZE
+        self.stats = [0] * 6
 
     def get_cache_components(self, physical_addr):
-        offset_bits = (self.CACHE_LINE_SIZE - 1).bit_length()
-        index_bits = (self.CACHE_SIZE - 1).bit_length()
-        index = (physical_addr >> offset_bits) & (self.CACHE_SIZE - 1)
-        tag = physical_addr >> (offset_bits + index_bits)
-        offset = physical_addr & (self.CACHE_LINE_SIZE - 1)
+        index = (physical_addr >> self._OFFSET_BITS) & self._INDEX_MASK
+        tag = physical_addr >> self._TAG_SHIFT
+        offset = physical_addr & self._OFFSET_MASK
         return tag, index, offset
 
     def handle_page_fault(self, page_num):
-        self.stats['page_faults'] += 1
-        frame_num = len(self.page_table) % self.NUM_PAGES
+        self.stats[PAGE_FAULTS] += 1
+        frame_num = self._next_frame & (self.NUM_PAGES - 1)    # NUM_PAGES is a power of two
+        self._next_frame += 1
         start_addr = frame_num * self.PAGE_SIZE
-        for i in range(self.PAGE_SIZE):
-            self.main_memory[start_addr + i] = (page_num + i) % 256
+        pattern_start = page_num & 0xFF
+        self.mem_mv[start_addr:start_addr + self.PAGE_SIZE] = _RING[pattern_start:pattern_start + self.PAGE_SIZE]
         self.page_table[page_num] = frame_num
+        self.page_table_count += 1
         return frame_num
 
     def update_tlb(self, page_num, frame_num):
-        if page_num in self.tlb:
-            return
-        if len(self.tlb) >= self.TLB_SIZE:
-            oldest_page = self.tlb_queue.popleft()
-            del self.tlb[oldest_page]
-        self.tlb[page_num] = frame_num
-        self.tlb_queue.append(page_num)
+        # Direct-mapped: the page always goes to slot page_num mod TLB_SIZE
+        index = page_num & (self.TLB_SIZE - 1)
+        self.tlb_tag[index] = page_num
+        self.tlb_frame[index] = frame_num
 
     def access_cache(self, physical_addr):
         tag, index, offset = self.get_cache_components(physical_addr)
-        cache_line = self.cache[index]
         
-        if cache_line['valid'] and cache_line['tag'] == tag:
-            self.stats['cache_hits'] += 1
-            return cache_line['data'][offset], True
+        if self.cache_valid[index] and self.cache_tag[index] == tag:
+            self.stats[CACHE_HITS] += 1
+            return (self.cache_data[index] >> (offset << 3)) & 0xFF, True
         else:
-            self.stats['cache_misses'] += 1
-            block_start = physical_addr & ~(self.CACHE_LINE_SIZE - 1)
-            for i in range(self.CACHE_LINE_SIZE):
-                cache_line['data'][i] = self.main_memory[block_start + i]
-            cache_line['tag'] = tag
-            cache_line['valid'] = True
-            cache_line['dirty'] = False
-            return cache_line['data'][offset], False
+            self.stats[CACHE_MISSES] += 1
+            block_start = physical_addr & ~self._OFFSET_MASK
+            line = int.from_bytes(self.mem_mv[block_start:block_start + self.CACHE_LINE_SIZE], 'little')
+            self.cache_data[index] = line
+            self.cache_tag[index] = tag
+            self.cache_valid[index] = True
+            self.cache_dirty[index] = False
+            return (line >> (offset << 3)) & 0xFF, False
 
     def translate_address(self, virtual_addr):
-        self.stats['total_accesses'] += 1
+        stats = self.stats
+        verbose = self.verbose
+        stats[TOTAL_ACCESSES] += 1
         
         page_num = (virtual_addr >> 8) & 0xFF
         offset = virtual_addr & 0xFF
         log_entries = []
         
         # TLB Check
-        if page_num in self.tlb:
-            frame_num = self.tlb[page_num]
-            self.stats['tlb_hits'] += 1
+        tlb_index = page_num & (self.TLB_SIZE - 1)
+        if self.tlb_tag[tlb_index] == page_num:
+            frame_num = self.tlb_frame[tlb_index]
+            stats[TLB_HITS] += 1
             tlb_hit = True
-            log_entries.append(f"✅TLB HIT: Page 0x{page_num:02X} -> Frame 0x{frame_num:02X}")
+            if verbose:
+                log_entries.append(f"✅TLB HIT: Page 0x{page_num:02X} -> Frame 0x{frame_num:02X}")
         else:
-            self.stats['tlb_misses'] += 1
+            stats[TLB_MISSES] += 1
             tlb_hit = False
-            log_entries.append(f"❌TLB MISS: Page 0x{page_num:02X}")
+            if verbose:
+                log_entries.append(f"❌TLB MISS: Page 0x{page_num:02X}")
             
             # Page Table Check
-            if page_num in self.page_table:
-                frame_num = self.page_table[page_num]
-                log_entries.append(f"✅PAGE TABLE HIT: Frame 0x{frame_num:02X}")
+            frame_num = self.page_table[page_num]
+            if frame_num >= 0:
+                if verbose:
+                    log_entries.append(f"✅PAGE TABLE HIT: Frame 0x{frame_num:02X}")
             else:
                 frame_num = self.handle_page_fault(page_num)
-                log_entries.append(f"🚨PAGE FAULT: Loading Page 0x{page_num:02X} to Frame 0x{frame_num:02X}")
+                if verbose:
+                    log_entries.append(f"🚨PAGE FAULT: Loading Page 0x{page_num:02X} to Frame 0x{frame_num:02X}")
             
             self.update_tlb(page_num, frame_num)
-            log_entries.append(f"TLB UPDATE: Added (Page 0x{page_num:02X} -> Frame 0x{frame_num:02X})")
+            if verbose:
+                log_entries.append(f"TLB UPDATE: Added (Page 0x{page_num:02X} -> Frame 0x{frame_num:02X})")
         
         # Physical Address
         physical_addr = (frame_num * self.PAGE_SIZE) + offset
-        log_entries.append(f"Physical Address: 0x{physical_addr:04X}")
-        
-        # Cache Check
-        value, cache_hit = self.access_cache(physical_addr)
-        if cache_hit:
-            log_entries.append(f"✅CACHE HIT: Value = {value}")
+        if verbose:
+            log_entries.append(f"Physical Address: 0x{physical_addr:04X}")
+        
+        # Cache Check (access_cache inlined to keep the hot path in one frame)
+        index = (physical_addr >> self._OFFSET_BITS) & self._INDEX_MASK
+        tag = physical_addr >> self._TAG_SHIFT
+        if self.cache_valid[index] and self.cache_tag[index] == tag:
+            stats[CACHE_HITS] += 1
+            line = self.cache_data[index]
+            cache_hit = True
         else:
-            log_entries.append(f"❌CACHE MISS: Loaded from memory, Value = {value}")
+            stats[CACHE_MISSES] += 1
+            block_start = physical_addr & ~self._OFFSET_MASK
+            line = int.from_bytes(self.mem_mv[block_start:block_start + self.CACHE_LINE_SIZE], 'little')
+            self.cache_data[index] = line
+            self.cache_tag[index] = tag
+            self.cache_valid[index] = True
+            self.cache_dirty[index] = False
+            cache_hit = False
+        value = (line >> ((physical_addr & self._OFFSET_MASK) << 3)) & 0xFF
+        
+        if verbose:
+            if cache_hit:
+                log_entries.append(f"✅CACHE HIT: Value = {value}")
+            else:
+                log_entries.append(f"❌CACHE MISS: Loaded from memory, Value = {value}")
         
         result = {
             'virtual_addr': virtual_addr,
@@ -117,7 +177,7 @@ class MemorySimulator:
             'frame_num': frame_num,
             'tlb_hit': tlb_hit,
             'cache_hit': cache_hit,
-            'log': log_entries
+            'log': log_entries or None
         }
         
         return result
@@ -129,6 +189,18 @@ class MemorySimulatorGUI:
         self.root.geometry("900x700")
         
         self.simulator = MemorySimulator()
+        
+        # Values currently shown in each Treeview, keyed by TLB slot, page
+        # and cache index, so refreshes only touch rows that changed
+        self._tlb_rows = {}
+        self._page_rows = {}
+        self._cache_rows = {}
+        self._used_page = None
+        
+        # Display refreshes are coalesced into one after_idle callback
+        self._pending_refresh = False
+        self._last_result = None
+        
         self.setup_gui()
         
     def setup_gui(self):
@@ -164,13 +236,15 @@ class MemorySimulatorGUI:
         input_frame = ttk.Frame(addr_frame)
         input_frame.pack(fill='x', padx=5, pady=5)
         
-        ttk.Label(input_frame, text="Virtual Address:").pack(side='left', padx=5)
+        ttk.Label(input_frame, text="Virtual Address(es):").pack(side='left', padx=5)
         
         self.addr_var = tk.StringVar()
-        addr_entry = ttk.Entry(input_frame, textvariable=self.addr_var, width=15)
+        addr_entry = ttk.Entry(input_frame, textvariable=self.addr_var, width=30)
         addr_entry.pack(side='left', padx=5)
         
         self.addr_format = tk.StringVar(value="hex")
+        self.addr_format.trace_add("write", self.update_parser)
+        self.update_parser()
         ttk.Radiobutton(input_frame, text="Hex", variable=self.addr_format, value="hex").pack(side='left', padx=5)
         ttk.Radiobutton(input_frame, text="Decimal", variable=self.addr_format, value="decimal").pack(side='left', padx=5)
         
@@ -193,13 +267,18 @@ class MemorySimulatorGUI:
         tlb_frame = ttk.Frame(parent)
         tlb_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
+        ttk.Label(tlb_frame, text=f"Direct-mapped TLB: page N is cached in slot N mod {self.simulator.TLB_SIZE}, "
+                  "replacing the page previously held there").pack(anchor='w', pady=(0, 5))
+        
         # TLB table
-        columns = ('page', 'frame')
+        columns = ('slot', 'page', 'frame')
         self.tlb_tree = ttk.Treeview(tlb_frame, columns=columns, show='headings', height=10)
         
+        self.tlb_tree.heading('slot', text='Slot')
         self.tlb_tree.heading('page', text='Page Number')
         self.tlb_tree.heading('frame', text='Frame Number')
         
+        self.tlb_tree.column('slot', width=60)
         self.tlb_tree.column('page', width=100)
         self.tlb_tree.column('frame', width=100)
         
@@ -253,99 +332,131 @@ class MemorySimulatorGUI:
         self.stats_text.pack(fill='both', expand=True)
         self.stats_text.config(state='disabled')
     
+    def update_parser(self, *args):
+        """Pick the address parser when the Hex/Decimal selection changes"""
+        self._parser = _parse_hex if self.addr_format.get() == "hex" else _parse_decimal
+    
     def process_address(self):
-        address_str = self.addr_var.get().strip()
-        if not address_str:
+        # Several addresses separated by spaces or commas are run as a trace
+        address_strs = self.addr_var.get().replace(',', ' ').split()
+        if not address_strs:
             messagebox.showerror("Error", "Please enter an address")
             return
             
-        if self.addr_format.get() == "hex" and not address_str.startswith("0x"):
-            address_str = "0x" + address_str
-            
         try:
-            if address_str.lower().startswith('0x'):
-                virtual_addr = int(address_str, 16)
-            else:
-                virtual_addr = int(address_str)
-                
-            if virtual_addr < 0 or virtual_addr > 0xFFFF:
-                messagebox.showerror("Error", "Address out of range (0x0000-0xFFFF)")
-                return
-                
-            result = self.simulator.translate_address(virtual_addr)
-            self.update_display(result)
-            
+            addresses = list(map(self._parser, address_strs))
         except ValueError:
             messagebox.showerror("Error", "Invalid address format")
+            return
+            
+        if any(virtual_addr < 0 or virtual_addr > 0xFFFF for virtual_addr in addresses):
+            messagebox.showerror("Error", "Address out of range (0x0000-0xFFFF)")
+            return
+            
+        self.process_addresses(addresses)
+    
+    def process_addresses(self, addresses):
+        """Translate each address in turn, then refresh the display once.
+        Only the last address is logged, so the rest skip building log lines."""
+        if not addresses:
+            return
+        simulator = self.simulator
+        previous_verbose = simulator.verbose
+        simulator.verbose = False
+        try:
+            for virtual_addr in addresses[:-1]:
+                simulator.translate_address(virtual_addr)
+        finally:
+            simulator.verbose = previous_verbose
+        self._last_result = simulator.translate_address(addresses[-1])
+        self.schedule_refresh()
+    
+    def schedule_refresh(self):
+        if not self._pending_refresh:
+            self._pending_refresh = True
+            self.root.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        self._pending_refresh = False
+        self.update_display(self._last_result)
     
     def reset_simulator(self):
         self.simulator.reset_simulator()
+        self._last_result = None
         self.addr_var.set("")
         self.update_display(None)
         self.log_message("Simulator reset successfully!")
     
     def update_display(self, result):
         # Update log
-        if result:
+        if result and result['log']:
             self.log_text.config(state='normal')
             self.log_text.delete(1.0, tk.END)
-            for log_entry in result['log']:
-                self.log_text.insert(tk.END, log_entry + '\n')
+            self.log_text.insert(tk.END, '\n'.join(result['log']) + '\n')
             self.log_text.config(state='disabled')
         
+        sim = self.simulator
+        
         # Update TLB tab
-        self.tlb_tree.delete(*self.tlb_tree.get_children())
-        for page, frame in self.simulator.tlb.items():
-            self.tlb_tree.insert('', 'end', values=(f"0x{page:02X}", f"0x{frame:02X}"))
-        
-        # Update Page Table tab
-        self.page_table_tree.delete(*self.page_table_tree.get_children())
-        for page, frame in self.simulator.page_table.items():
-            status = "USED" if result and page == result['page_num'] else "LOADED"
-            self.page_table_tree.insert('', 'end', values=(
-                f"0x{page:02X}", 
-                f"0x{frame:02X}", 
-                status
-            ))
+        for i in range(sim.TLB_SIZE):
+            page = sim.tlb_tag[i]
+            row = None
+            if page >= 0:
+                row = (str(i), f"0x{page:02X}", f"0x{sim.tlb_frame[i]:02X}")
+            self.sync_row(self.tlb_tree, self._tlb_rows, i, row)
+        
+        # Update Page Table tab (rows kept in page-number order); only walk
+        # the table when pages were mapped or the USED page moved
+        used_page = result['page_num'] if result else None
+        if sim.page_table_count != len(self._page_rows) or used_page != self._used_page:
+            for page, frame in enumerate(sim.page_table):
+                row = None
+                if frame >= 0:
+                    status = "USED" if page == used_page else "LOADED"
+                    row = (f"0x{page:02X}", f"0x{frame:02X}", status)
+                self.sync_row(self.page_table_tree, self._page_rows, page, row)
+            self._used_page = used_page
         
         # Update Cache tab
-        self.cache_tree.delete(*self.cache_tree.get_children())
-        for i, line in enumerate(self.simulator.cache):
-            if line['valid']:
-                data_preview = ' '.join(f"{b:02X}" for b in line['data'][:3])
-                self.cache_tree.insert('', 'end', values=(
+        for i in range(sim.CACHE_SIZE):
+            row = None
+            if sim.cache_valid[i]:
+                line_bytes = sim.cache_data[i].to_bytes(sim.CACHE_LINE_SIZE, 'little')
+                data_preview = ' '.join(f"{b:02X}" for b in line_bytes[:3])
+                row = (
                     str(i), 
                     "YES", 
-                    f"0x{line['tag']:02X}", 
+                    f"0x{sim.cache_tag[i]:02X}", 
                     data_preview + "..."
-                ))
+                )
+            self.sync_row(self.cache_tree, self._cache_rows, i, row)
         
         # Update Statistics tab
         stats = self.simulator.stats
-        tlb_total = stats['tlb_hits'] + stats['tlb_misses']
-        cache_total = stats['cache_hits'] + stats['cache_misses']
+        tlb_total = stats[TLB_HITS] + stats[TLB_MISSES]
+        cache_total = stats[CACHE_HITS] + stats[CACHE_MISSES]
         
-        tlb_hit_rate = (stats['tlb_hits'] / tlb_total * 100) if tlb_total > 0 else 0
-        cache_hit_rate = (stats['cache_hits'] / cache_total * 100) if cache_total > 0 else 0
+        tlb_hit_rate = (stats[TLB_HITS] / tlb_total * 100) if tlb_total > 0 else 0
+        cache_hit_rate = (stats[CACHE_HITS] / cache_total * 100) if cache_total > 0 else 0
         
         stats_text = f"""MEMORY MANAGEMENT STATISTICS
 
 TLB Performance:
-✅Hits: {stats['tlb_hits']}
-❌Misses: {stats['tlb_misses']}
+✅Hits: {stats[TLB_HITS]}
+❌Misses: {stats[TLB_MISSES]}
 📈Hit Rate: {tlb_hit_rate:.1f}%
 
 Cache Performance:
-✅Hits: {stats['cache_hits']}
-❌Misses: {stats['cache_misses']}
+✅Hits: {stats[CACHE_HITS]}
+❌Misses: {stats[CACHE_MISSES]}
 📈Hit Rate: {cache_hit_rate:.1f}%
 
 System Events:
-🚨Page Faults: {stats['page_faults']}
-🔢Total Accesses: {stats['total_accesses']}
+🚨Page Faults: {stats[PAGE_FAULTS]}
+🔢Total Accesses: {stats[TOTAL_ACCESSES]}
 
 Page Table:
-📖Total Pages: {len(self.simulator.page_table)}
+📖Total Pages: {sim.page_table_count}
 """
         
         self.stats_text.config(state='normal')
@@ -353,6 +464,24 @@ Page Table:
         self.stats_text.insert(tk.END, stats_text)
         self.stats_text.config(state='disabled')
     
+    def sync_row(self, tree, rows, key, values):
+        """Make the row for key show values, inserting it in key order or
+        deleting it when values is None; unchanged rows are left alone"""
+        current = rows.get(key)
+        if values == current:
+            return
+        iid = str(key)
+        if values is None:
+            tree.delete(iid)
+            del rows[key]
+        elif current is None:
+            position = sum(1 for k in rows if k < key)
+            tree.insert('', position, iid=iid, values=values)
+            rows[key] = values
+        else:
+            tree.item(iid, values=values)
+            rows[key] = values
+    
     def log_message(self, message):
         self.log_text.config(state='normal')
         self.log_text.insert(tk.END, message + '\n')
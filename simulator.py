@@ -1,5 +1,9 @@
-import random
-from collections import deque
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; translate_batch falls back to NumPy
+    njit = None
 
 # Configuration
 MEMORY_SIZE = 65536      # 64 KB RAM
@@ -9,15 +13,38 @@ CACHE_SIZE = 64          # 64 cache lines
 CACHE_LINE_SIZE = 8      # 8 bytes per cache line
 NUM_PAGES = MEMORY_SIZE // PAGE_SIZE
 
+# Build log lines in translate_address; turn off for fast non-interactive runs
+verbose = True
+
+# Ring of byte values; page p is loaded with _RING[p:p + PAGE_SIZE], i.e.
+# bytes (p + i) & 0xFF, as a zero-copy slice
+_RING = memoryview(bytes(i & 0xFF for i in range(256 + PAGE_SIZE)))
+
+def _aligned_zeros(shape, dtype, alignment=64):
+    """Zero-filled array whose data starts on an alignment-byte boundary"""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buffer = np.zeros(nbytes + alignment, dtype=np.uint8)
+    start = -buffer.ctypes.data % alignment
+    return buffer[start:start + nbytes].view(dtype).reshape(shape)
+
 # Data Structures
-main_memory = bytearray([random.randint(0, 255) for _ in range(MEMORY_SIZE)])
-page_table = {}          # {page_num: frame_num}
-tlb = {}                 # {page_num: frame_num}
-tlb_queue = deque()      # For FIFO replacement
+main_memory = bytearray(MEMORY_SIZE)     # zero-filled; pages get their contents when faulted in
+mem_mv = memoryview(main_memory)     # zero-copy view for slice reads/writes
+page_table = np.full(NUM_PAGES, -1, dtype=np.int16)   # frame for each page, -1 if unmapped
+page_table_count = 0     # number of mapped pages
+_next_frame = 0          # next frame to hand out on a page fault
+
+# TLB: direct-mapped, page_num & (TLB_SIZE - 1) selects the slot
+tlb_tag = np.full(TLB_SIZE, -1, dtype=np.int16)     # page held by each slot, -1 if empty
+tlb_frame = np.zeros(TLB_SIZE, dtype=np.uint8)      # frame for that page
 
-# Cache: list of {tag, data, valid, dirty}
-cache = [{'tag': -1, 'data': bytearray(CACHE_LINE_SIZE), 'valid': False, 'dirty': False} 
-         for _ in range(CACHE_SIZE)]
+# Cache: structure-of-arrays, one slot per cache line. Each 8-byte line is
+# packed little-endian into one uint64, so byte n is (line >> 8*n) & 0xFF
+cache_tag = np.full(CACHE_SIZE, -1, dtype=np.int32)
+cache_valid = np.zeros(CACHE_SIZE, dtype=np.bool_)
+cache_dirty = np.zeros(CACHE_SIZE, dtype=np.bool_)
+cache_data = _aligned_zeros(CACHE_SIZE, np.uint64)   # 64-byte aligned
 
 # Statistics
 stats = {
@@ -33,66 +60,64 @@ stats = {
 CACHE_OFFSET_BITS = (CACHE_LINE_SIZE - 1).bit_length()
 CACHE_INDEX_BITS = (CACHE_SIZE - 1).bit_length()
 CACHE_TAG_BITS = 16 - CACHE_INDEX_BITS - CACHE_OFFSET_BITS
+CACHE_TAG_SHIFT = CACHE_OFFSET_BITS + CACHE_INDEX_BITS
+CACHE_INDEX_MASK = CACHE_SIZE - 1
+CACHE_OFFSET_MASK = CACHE_LINE_SIZE - 1
 
 def get_cache_components(physical_addr):
     """Extract tag, index, and offset from physical address"""
-    index = (physical_addr >> CACHE_OFFSET_BITS) & (CACHE_SIZE - 1)
-    tag = physical_addr >> (CACHE_OFFSET_BITS + CACHE_INDEX_BITS)
-    offset = physical_addr & (CACHE_LINE_SIZE - 1)
+    index = (physical_addr >> CACHE_OFFSET_BITS) & CACHE_INDEX_MASK
+    tag = physical_addr >> CACHE_TAG_SHIFT
+    offset = physical_addr & CACHE_OFFSET_MASK
     return tag, index, offset
 
 # Core Functions
 def handle_page_fault(page_num):
     """Simulate loading a page from disk into memory"""
-    global stats
+    global stats, page_table_count, _next_frame
     stats['page_faults'] += 1
     
     # Find a free frame
-    frame_num = len(page_table) % NUM_PAGES
+    frame_num = _next_frame & (NUM_PAGES - 1)     # NUM_PAGES is a power of two
+    _next_frame += 1
     
     # Load data (simulate with pattern)
     start_addr = frame_num * PAGE_SIZE
-    for i in range(PAGE_SIZE):
-        main_memory[start_addr + i] = (page_num + i) % 256
+    pattern_start = page_num & 0xFF
+    mem_mv[start_addr:start_addr + PAGE_SIZE] = _RING[pattern_start:pattern_start + PAGE_SIZE]
     
     page_table[page_num] = frame_num
+    page_table_count += 1
     return frame_num
 
 def update_tlb(page_num, frame_num):
-    """Update TLB with FIFO replacement policy"""
-    if page_num in tlb:
-        return
-    
-    if len(tlb) >= TLB_SIZE:
-        oldest_page = tlb_queue.popleft()
-        del tlb[oldest_page]
-    
-    tlb[page_num] = frame_num
-    tlb_queue.append(page_num)
+    """Update TLB, replacing whatever page held the slot"""
+    index = page_num & (TLB_SIZE - 1)
+    tlb_tag[index] = page_num
+    tlb_frame[index] = frame_num
 
 def access_cache(physical_addr):
     """Access cache, return value and whether it was a hit"""
     global stats
     
     tag, index, offset = get_cache_components(physical_addr)
-    cache_line = cache[index]
     
-    if cache_line['valid'] and cache_line['tag'] == tag:
+    if cache_valid[index] and cache_tag[index] == tag:
         stats['cache_hits'] += 1
-        return cache_line['data'][offset], True
+        return (int(cache_data[index]) >> (offset << 3)) & 0xFF, True
     else:
         stats['cache_misses'] += 1
         
         # Read entire block from main memory
-        block_start = physical_addr & ~(CACHE_LINE_SIZE - 1)
-        for i in range(CACHE_LINE_SIZE):
-            cache_line['data'][i] = main_memory[block_start + i]
+        block_start = physical_addr & ~CACHE_OFFSET_MASK
+        line = int.from_bytes(mem_mv[block_start:block_start + CACHE_LINE_SIZE], 'little')
+        cache_data[index] = line
         
-        cache_line['tag'] = tag
-        cache_line['valid'] = True
-        cache_line['dirty'] = False
+        cache_tag[index] = tag
+        cache_valid[index] = True
+        cache_dirty[index] = False
         
-        return cache_line['data'][offset], False
+        return (line >> (offset << 3)) & 0xFF, False
 
 def translate_address(virtual_addr):
     """Translate virtual address through memory hierarchy"""
@@ -106,37 +131,61 @@ def translate_address(virtual_addr):
     log_entries = []
     
     # Step 1: Check TLB
-    if page_num in tlb:
-        frame_num = tlb[page_num]
+    tlb_index = page_num & (TLB_SIZE - 1)
+    if tlb_tag[tlb_index] == page_num:
+        frame_num = int(tlb_frame[tlb_index])
         stats['tlb_hits'] += 1
         tlb_hit = True
-        log_entries.append(f"TLB HIT: Page 0x{page_num:02X} -> Frame 0x{frame_num:02X}")
+        if verbose:
+            log_entries.append(f"TLB HIT: Page 0x{page_num:02X} -> Frame 0x{frame_num:02X}")
     else:
         stats['tlb_misses'] += 1
         tlb_hit = False
-        log_entries.append(f"TLB MISS: Page 0x{page_num:02X}")
+        if verbose:
+            log_entries.append(f"TLB MISS: Page 0x{page_num:02X}")
         
         # Step 2: Check Page Table
-        if page_num in page_table:
-            frame_num = page_table[page_num]
-            log_entries.append(f"PAGE TABLE HIT: Frame 0x{frame_num:02X}")
+        frame_num = int(page_table[page_num])
+        if frame_num >= 0:
+            if verbose:
+                log_entries.append(f"PAGE TABLE HIT: Frame 0x{frame_num:02X}")
         else:
             frame_num = handle_page_fault(page_num)
-            log_entries.append(f"PAGE FAULT: Loading Page 0x{page_num:02X} to Frame 0x{frame_num:02X}")
+            if verbose:
+                log_entries.append(f"PAGE FAULT: Loading Page 0x{page_num:02X} to Frame 0x{frame_num:02X}")
         
         update_tlb(page_num, frame_num)
-        log_entries.append(f"TLB UPDATE: Added (Page 0x{page_num:02X} -> Frame 0x{frame_num:02X})")
+        if verbose:
+            log_entries.append(f"TLB UPDATE: Added (Page 0x{page_num:02X} -> Frame 0x{frame_num:02X})")
     
     # Calculate physical address
     physical_addr = (frame_num * PAGE_SIZE) + offset
-    log_entries.append(f"Physical Address: 0x{physical_addr:04X}")
+    if verbose:
+        log_entries.append(f"Physical Address: 0x{physical_addr:04X}")
     
-    # Step 4: Check Cache
-    value, cache_hit = access_cache(physical_addr)
-    if cache_hit:
-        log_entries.append(f"CACHE HIT: Value = {value}")
+    # Step 4: Check Cache (access_cache inlined to keep the hot path in one frame)
+    index = (physical_addr >> CACHE_OFFSET_BITS) & CACHE_INDEX_MASK
+    tag = physical_addr >> CACHE_TAG_SHIFT
+    if cache_valid[index] and cache_tag[index] == tag:
+        stats['cache_hits'] += 1
+        line = int(cache_data[index])
+        cache_hit = True
     else:
-        log_entries.append(f"CACHE MISS: Loaded from memory, Value = {value}")
+        stats['cache_misses'] += 1
+        block_start = physical_addr & ~CACHE_OFFSET_MASK
+        line = int.from_bytes(mem_mv[block_start:block_start + CACHE_LINE_SIZE], 'little')
+        cache_data[index] = line
+        cache_tag[index] = tag
+        cache_valid[index] = True
+        cache_dirty[index] = False
+        cache_hit = False
+    value = (line >> ((physical_addr & CACHE_OFFSET_MASK) << 3)) & 0xFF
+    
+    if verbose:
+        if cache_hit:
+            log_entries.append(f"CACHE HIT: Value = {value}")
+        else:
+            log_entries.append(f"CACHE MISS: Loaded from memory, Value = {value}")
     
     return {
         'virtual_addr': virtual_addr,
@@ -146,21 +195,210 @@ def translate_address(virtual_addr):
         'frame_num': frame_num,
         'tlb_hit': tlb_hit,
         'cache_hit': cache_hit,
-        'log': log_entries
+        'log': log_entries or None
     }
 
+# Batch Functions
+def _previous_in_group(keys, values, initial):
+    """For each position, the value last seen under the same key earlier in
+    the batch, or initial at that position if the key has not appeared yet"""
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    previous = np.roll(values[order], 1)
+    first = np.ones(len(keys), dtype=np.bool_)
+    first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    previous[first] = initial[order][first]
+    result = np.empty_like(previous)
+    result[order] = previous
+    return result
+
+def _last_in_group(keys):
+    """Return each distinct key and the position of its last occurrence"""
+    unique_keys, reversed_pos = np.unique(keys[::-1], return_index=True)
+    return unique_keys, len(keys) - 1 - reversed_pos
+
+def _translate_kernel(addrs, memory, page_table, next_frame, tlb_tag, tlb_frame,
+                      cache_tag, cache_valid, cache_dirty, cache_data, counts):
+    """Scalar translation loop over plain arrays, compiled with Numba.
+    counts accumulates tlb hits/misses, cache hits/misses and page faults."""
+    count = addrs.shape[0]
+    physical = np.empty(count, dtype=np.int64)
+    frames = np.empty(count, dtype=np.int64)
+    values = np.empty(count, dtype=np.uint8)
+    tlb_hits = np.empty(count, dtype=np.bool_)
+    cache_hits = np.empty(count, dtype=np.bool_)
+    
+    for k in range(count):
+        page_num = (addrs[k] >> 8) & 0xFF
+        offset = addrs[k] & 0xFF
+        
+        tlb_index = page_num & (TLB_SIZE - 1)
+        if tlb_tag[tlb_index] == page_num:
+            frame_num = np.int64(tlb_frame[tlb_index])
+            counts[0] += 1
+            tlb_hits[k] = True
+        else:
+            counts[1] += 1
+            tlb_hits[k] = False
+            frame_num = np.int64(page_table[page_num])
+            if frame_num < 0:
+                counts[4] += 1
+                frame_num = next_frame & (NUM_PAGES - 1)
+                next_frame += 1
+                start_addr = frame_num * PAGE_SIZE
+                for i in range(PAGE_SIZE):
+                    memory[start_addr + i] = (page_num + i) & 0xFF
+                page_table[page_num] = frame_num
+            tlb_tag[tlb_index] = page_num
+            tlb_frame[tlb_index] = frame_num
+        
+        physical_addr = frame_num * PAGE_SIZE + offset
+        index = (physical_addr >> CACHE_OFFSET_BITS) & CACHE_INDEX_MASK
+        tag = physical_addr >> CACHE_TAG_SHIFT
+        if cache_valid[index] and cache_tag[index] == tag:
+            counts[2] += 1
+            cache_hits[k] = True
+        else:
+            counts[3] += 1
+            cache_hits[k] = False
+            block_start = physical_addr & ~CACHE_OFFSET_MASK
+            line = np.uint64(0)
+            for i in range(CACHE_LINE_SIZE):
+                line |= np.uint64(memory[block_start + i]) << np.uint64(8 * i)
+            cache_data[index] = line
+            cache_tag[index] = tag
+            cache_valid[index] = True
+            cache_dirty[index] = False
+        
+        physical[k] = physical_addr
+        frames[k] = frame_num
+        shift = np.uint64((physical_addr & CACHE_OFFSET_MASK) << 3)
+        values[k] = (cache_data[index] >> shift) & np.uint64(0xFF)
+    
+    return physical, frames, values, tlb_hits, cache_hits
+
+_translate_jit = njit(cache=True)(_translate_kernel) if njit is not None else None
+
+def _translate_batch_jit(addrs):
+    """Run a batch through the compiled kernel, then fold its counters into stats"""
+    global page_table_count, _next_frame
+    counts = np.zeros(5, dtype=np.int64)
+    physical, frames, values, tlb_hits, cache_hits = _translate_jit(
+        addrs, np.frombuffer(main_memory, dtype=np.uint8), page_table, _next_frame,
+        tlb_tag, tlb_frame, cache_tag, cache_valid, cache_dirty, cache_data, counts)
+    
+    page_table_count += int(counts[4])
+    _next_frame += int(counts[4])
+    stats['total_accesses'] += len(addrs)
+    stats['tlb_hits'] += int(counts[0])
+    stats['tlb_misses'] += int(counts[1])
+    stats['cache_hits'] += int(counts[2])
+    stats['cache_misses'] += int(counts[3])
+    stats['page_faults'] += int(counts[4])
+    
+    return {
+        'virtual_addr': addrs,
+        'physical_addr': physical,
+        'value': values,
+        'page_num': (addrs >> 8) & 0xFF,
+        'frame_num': frames,
+        'tlb_hit': tlb_hits,
+        'cache_hit': cache_hits
+    }
+
+def _translate_batch_numpy(addrs):
+    """Resolve a batch with array operations.
+    
+    TLB and cache are direct-mapped, so an access hits exactly when the
+    previous access to the same slot used the same tag; this lets the whole
+    batch be resolved at once. Only page faults go through the scalar
+    handle_page_fault.
+    """
+    count = len(addrs)
+    
+    pages = (addrs >> 8) & 0xFF
+    offsets = addrs & 0xFF
+    
+    # TLB: hit if the slot still holds this page
+    tlb_index = pages & (TLB_SIZE - 1)
+    tlb_hits = _previous_in_group(tlb_index, pages, tlb_tag[tlb_index].astype(np.int64)) == pages
+    
+    # Page faults: first touch of each unmapped page, in the order they occur
+    unique_pages, first_pos = np.unique(pages, return_index=True)
+    for page_num in unique_pages[np.argsort(first_pos)].tolist():
+        if page_table[page_num] < 0:
+            handle_page_fault(page_num)
+    
+    frames = page_table[pages].astype(np.int64)
+    physical = frames * PAGE_SIZE + offsets
+    
+    # Cache: hit if the line is valid and still holds this tag
+    cache_index = (physical >> CACHE_OFFSET_BITS) & CACHE_INDEX_MASK
+    tags = physical >> CACHE_TAG_SHIFT
+    initial_tags = np.where(cache_valid[cache_index], cache_tag[cache_index], -1)
+    cache_hits = _previous_in_group(cache_index, tags, initial_tags) == tags
+    
+    # Frames are only written when first faulted in, before any access can
+    # cache them, so cached bytes always match main memory
+    memory = np.frombuffer(main_memory, dtype=np.uint8)
+    values = memory[physical]
+    
+    # Leave TLB and cache holding the last entry mapped to each slot
+    slots, last = _last_in_group(tlb_index)
+    tlb_tag[slots] = pages[last]
+    tlb_frame[slots] = frames[last]
+    
+    lines, last = _last_in_group(cache_index)
+    block_starts = physical[last] & ~CACHE_OFFSET_MASK
+    line_bytes = memory[block_starts[:, None] + np.arange(CACHE_LINE_SIZE)]
+    cache_data[lines] = line_bytes.view('<u8').ravel()
+    cache_tag[lines] = tags[last]
+    cache_valid[lines] = True
+    cache_dirty[lines] = False
+    
+    tlb_hit_count = int(np.count_nonzero(tlb_hits))
+    cache_hit_count = int(np.count_nonzero(cache_hits))
+    stats['total_accesses'] += count
+    stats['tlb_hits'] += tlb_hit_count
+    stats['tlb_misses'] += count - tlb_hit_count
+    stats['cache_hits'] += cache_hit_count
+    stats['cache_misses'] += count - cache_hit_count
+    
+    return {
+        'virtual_addr': addrs,
+        'physical_addr': physical,
+        'value': values,
+        'page_num': pages,
+        'frame_num': frames,
+        'tlb_hit': tlb_hits,
+        'cache_hit': cache_hits
+    }
+
+def translate_batch(virtual_addrs):
+    """Translate an array of virtual addresses in order, without logging.
+    
+    Uses the Numba-compiled kernel when Numba is installed (the first call
+    pays the compile cost) and the NumPy implementation otherwise. State and
+    statistics end up the same as calling translate_address on each address
+    in turn.
+    """
+    addrs = np.asarray(virtual_addrs, dtype=np.int64).ravel()
+    if _translate_jit is not None:
+        return _translate_batch_jit(addrs)
+    return _translate_batch_numpy(addrs)
+
 # Snapshot Functions
 def get_tlb_snapshot():
     """Return current TLB state"""
-    return dict(tlb)
+    return {int(tlb_tag[i]): int(tlb_frame[i]) for i in np.flatnonzero(tlb_tag >= 0)}
 
 def get_cache_snapshot():
     """Return current cache state"""
-    return cache
+    return {'tag': cache_tag, 'data': cache_data, 'valid': cache_valid, 'dirty': cache_dirty}
 
 def get_page_table_snapshot():
     """Return current page table state"""
-    return dict(page_table)
+    return {int(p): int(page_table[p]) for p in np.flatnonzero(page_table >= 0)}
 
 def get_stats():
     """Return current statistics"""
@@ -168,14 +406,19 @@ def get_stats():
 
 def reset_simulator():
     """Reset all simulator state"""
-    global main_memory, page_table, tlb, tlb_queue, cache, stats
-    
-    main_memory = bytearray([random.randint(0, 255) for _ in range(MEMORY_SIZE)])
-    page_table = {}
-    tlb = {}
-    tlb_queue = deque()
-    cache = [{'tag': -1, 'data': bytearray(CACHE_LINE_SIZE), 'valid': False, 'dirty': False} 
-             for _ in range(CACHE_SIZE)]
+    global main_memory, mem_mv, page_table_count, _next_frame, stats
+    
+    main_memory = bytearray(MEMORY_SIZE)
+    mem_mv = memoryview(main_memory)
+    page_table.fill(-1)
+    page_table_count = 0
+    _next_frame = 0
+    tlb_tag.fill(-1)
+    tlb_frame.fill(0)
+    cache_tag.fill(-1)
+    cache_valid.fill(False)
+    cache_dirty.fill(False)
+    cache_data.fill(0)
     stats = {
         'tlb_hits': 0, 'tlb_misses': 0, 'cache_hits': 0, 
         'cache_misses': 0, 'page_faults': 0, 'total_accesses': 0
@@ -0,0 +1,102 @@
+import random
+import unittest
+
+import numpy as np
+
+import simulator
+
+RESULT_FIELDS = ('physical_addr', 'value', 'page_num', 'frame_num', 'tlb_hit', 'cache_hit')
+
+def make_traces():
+    """Address traces, each split into the batches it is fed in"""
+    rng = random.Random(1234)
+    hot = [rng.randrange(0x800) for _ in range(3000)]
+    mixed = [rng.choice([rng.randrange(0x10000), rng.randrange(0x1000)]) for _ in range(3000)]
+    return {
+        'empty': [[]],
+        'single': [[0x1234]],
+        'repeat': [[0x1234, 0x1235, 0x1234, 0x1238]],
+        'all_pages': [[page << 8 | 0x42 for page in rng.sample(range(256), 256)]],
+        'hot_one_batch': [hot],
+        'hot_split': [hot[:1], hot[1:700], [], hot[700:701], hot[701:]],
+        'mixed_split': [mixed[:1000], mixed[1000:1003], mixed[1003:]],
+    }
+
+def snapshot():
+    """Everything a translation can change"""
+    cache = {key: array.copy() for key, array in simulator.get_cache_snapshot().items()}
+    return {
+        'stats': simulator.get_stats(),
+        'tlb': simulator.get_tlb_snapshot(),
+        'page_table': simulator.get_page_table_snapshot(),
+        'cache': cache,
+        'memory': bytes(simulator.main_memory),
+        'page_table_count': simulator.page_table_count,
+        'next_frame': simulator._next_frame,
+    }
+
+def run_scalar(batches):
+    simulator.reset_simulator()
+    simulator.verbose = False
+    try:
+        results = {field: [] for field in RESULT_FIELDS}
+        for batch in batches:
+            for virtual_addr in batch:
+                result = simulator.translate_address(virtual_addr)
+                for field in RESULT_FIELDS:
+                    results[field].append(result[field])
+    finally:
+        simulator.verbose = True
+    return results, snapshot()
+
+def run_batch(batch_fn, batches):
+    simulator.reset_simulator()
+    results = {field: [] for field in RESULT_FIELDS}
+    for batch in batches:
+        result = batch_fn(np.asarray(batch, dtype=np.int64))
+        for field in RESULT_FIELDS:
+            results[field].extend(result[field].tolist())
+    return results, snapshot()
+
+class TranslateBatchTest(unittest.TestCase):
+    """Every batch path must match translate_address access for access"""
+
+    def tearDown(self):
+        simulator.reset_simulator()
+
+    def assert_same_sequence(self, actual, expected, field):
+        # Report the first diverging access instead of diffing whole traces
+        self.assertEqual(len(actual), len(expected), field)
+        for k, (got, want) in enumerate(zip(actual, expected)):
+            if got != want:
+                self.fail(f"{field} differs at access {k}: {got!r} != {want!r}")
+
+    def assert_matches_scalar(self, batch_fn):
+        for name, batches in make_traces().items():
+            with self.subTest(trace=name):
+                expected_results, expected_state = run_scalar(batches)
+                results, state = run_batch(batch_fn, batches)
+
+                for field in RESULT_FIELDS:
+                    self.assert_same_sequence(results[field], expected_results[field], field)
+                self.assertEqual(state['stats'], expected_state['stats'])
+                self.assertEqual(state['tlb'], expected_state['tlb'])
+                self.assertEqual(state['page_table'], expected_state['page_table'])
+                self.assertEqual(state['memory'], expected_state['memory'])
+                self.assertEqual(state['page_table_count'], expected_state['page_table_count'])
+                self.assertEqual(state['next_frame'], expected_state['next_frame'])
+                for key, array in expected_state['cache'].items():
+                    np.testing.assert_array_equal(state['cache'][key], array, err_msg=key)
+
+    def test_numpy_path_matches_scalar(self):
+        self.assert_matches_scalar(simulator._translate_batch_numpy)
+
+    @unittest.skipIf(simulator._translate_jit is None, "Numba is not installed")
+    def test_numba_kernel_matches_scalar(self):
+        self.assert_matches_scalar(simulator._translate_batch_jit)
+
+    def test_translate_batch_matches_scalar(self):
+        self.assert_matches_scalar(simulator.translate_batch)
+
+if __name__ == '__main__':
+    unittest.main()